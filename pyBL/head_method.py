@@ -25,16 +25,31 @@ class HeadMethod(IBLMethod):
     velocity profile and other configuration information.
     """
 
+    # Coefficients (a, b, c, d) of H1 = d + a/(H_d - b)**c for H_d<=1.6
+    _H1_LOW = (0.8234, 1.1, 1.287, 3.3)
+    # Coefficients (a, b, c, d) of H1 = d + a/(H_d - b)**c for H_d>1.6
+    _H1_HIGH = (1.5501, 0.6778, 3.064, 3.32254659218600974)
+    # Coefficients (a, b, c) of S = a/(H1 - b)**c
+    _S_C = (0.0306, 3.0, 0.6169)
+    # Entrainment shape factor where H1 relations switch (H_d=1.6)
+    _H1_BREAK = _H1_LOW[3] + _H1_LOW[0]/(1.6 - _H1_LOW[1])**_H1_LOW[2]
+
     # Attributes
     # ----------
     #    _delta_m0: Momentum thickness at start location
     #    _H_d0: Displacement shape factor at start location
+    #    _x_cache: Locations of most recent solution evaluation
+    #    _sol_cache: Solution at `_x_cache`
+    #    _sol_cache_src: Solution object used to evaluate `_sol_cache`
     def __init__(self, nu: float = 1.0, U_e=None, dU_edx=None, d2U_edx2=None,
                  H_d_crit=2.4):
         super().__init__(nu, U_e, dU_edx, d2U_edx2)
 
         self._H_d0 = None
         self._delta_m0 = None
+        self._x_cache = None
+        self._sol_cache = None
+        self._sol_cache_src = None
         self.set_H_d_critical(H_d_crit)
 
     def set_H_d_critical(self, H_d_crit):
@@ -95,12 +110,14 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired transpiration velocity at the specified locations.
         """
-        yp = self._ode_impl(x, self._solution(x))
-        H_d = self.H_d(x)
+        sol = self._solution_cached(x)
+        delta_m = sol[0]
+        H_d = sol[1]
         U_e = self.U_e(x)
         dU_edx = self.dU_edx(x)
-        delta_m = self.delta_m(x)
-        return dU_edx*H_d*delta_m + U_e*yp[1]*delta_m + U_e*H_d*yp[0]
+        yp = self._calc_rhs(sol, U_e, dU_edx)
+        # streamwise derivative of U_e*H_d*delta_m
+        return U_e*(yp[1]*delta_m + H_d*yp[0]) + dU_edx*H_d*delta_m
 
     def delta_d(self, x):
         """
@@ -116,7 +133,8 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired displacement thickness at the specified locations.
         """
-        return self.delta_m(x)*self.H_d(x)
+        sol = self._solution_cached(x)
+        return sol[0]*sol[1]
 
     def delta_m(self, x):
         """
@@ -132,7 +150,7 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired momentum thickness at the specified locations.
         """
-        return self._solution(x)[0]
+        return np.array(self._solution_cached(x)[0])
 
     def delta_k(self, x):
         """
@@ -148,7 +166,7 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired kinetic energy thickness at the specified locations.
         """
-        return np.zeros_like(x)
+        return np.zeros(np.shape(x))
 
     def H_d(self, x):
         """
@@ -164,7 +182,7 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired displacement shape factor at the specified locations.
         """
-        return self._solution(x)[1]
+        return np.array(self._solution_cached(x)[1])
 
     def H_k(self, x):
         """
@@ -180,7 +198,8 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired kinetic energy shape factor at the specified locations.
         """
-        return self.delta_k(x)/self.delta_m(x)
+        # kinetic energy thickness is not modeled, so H_k is also zero
+        return np.zeros(np.shape(x))
 
     def tau_w(self, x, rho):
         """
@@ -198,13 +217,11 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired wall shear stress at the specified locations.
         """
-        delta_m = self._solution(x)[0]
-        H_d = self._solution(x)[1]
+        sol = self._solution_cached(x)
         U_e = self.U_e(x)
-        U_e[np.abs(U_e) < 0.001] = 0.001
-        Re_delta_m = U_e*delta_m/self._nu
-        c_f = c_f_fun(Re_delta_m, H_d)
-        return 0.5*rho*U_e**2*c_f
+        U_e = np.where(np.abs(U_e) < 0.001, 0.001, U_e)
+        c_f = c_f_fun(U_e*sol[0]/self._nu, sol[1])
+        return (0.5*rho)*U_e*U_e*c_f
 
     def D(self, x, rho):
         """
@@ -222,7 +239,7 @@ class HeadMethod(IBLMethod):
         array-like same shape as `x`
             Desired dissipation integral at the specified locations.
         """
-        return np.zeros_like(x)
+        return np.zeros(np.shape(x))
 
     def _ode_setup(self) -> Tuple[np_type.NDArray, float, float]:
         """
@@ -254,105 +271,185 @@ class HeadMethod(IBLMethod):
         array-like same shape as `F`
             The right-hand side of the ODE at the given state.
         """
-        Fp = np.zeros_like(F)
+        # NOTE: A new array is returned on every call instead of reusing a
+        #       buffer because the solver keeps a reference to the previous
+        #       derivative while evaluating the next stages.
+        if np.isscalar(x):
+            # solver passes scalar location, so avoid array overhead
+            x = float(x)
+            U_e_fun, dU_edx_fun = self._scalar_velocity()
+            return np.array(self._calc_rhs_scalar(float(F[0]), float(F[1]),
+                                                  U_e_fun(x), dU_edx_fun(x),
+                                                  self._nu))
+
+        return self._calc_rhs(F, self.U_e(x), self.dU_edx(x))
+
+    def _calc_rhs(self, F, U_e, dU_edx):
+        """
+        Calculate the right-hand side of the ODE from known edge velocity.
+
+        Parameters
+        ----------
+        F: array-like
+            Solution vector of momentum thickness and displacement shape
+            factor.
+        U_e: array-like
+            Edge velocity at the locations of `F`.
+        dU_edx: array-like
+            Streamwise derivative of the edge velocity at the locations of
+            `F`.
+
+        Returns
+        -------
+        array-like same shape as `F`
+            The right-hand side of the ODE at the given state.
+        """
         delta_m = F[0]
-        H_d = np.asarray(F[1])
-        if (H_d < 1.11).any():
-            H_d[H_d < 1.11] = 1.11
-        U_e = self.U_e(x)
-        U_e[np.abs(U_e) < 0.001] = 0.001
-        dU_edx = self.dU_edx(x)
+        H_d = np.maximum(F[1], 1.11)
+        U_e = np.where(np.abs(U_e) < 0.001, 0.001, U_e)
         Re_delta_m = U_e*delta_m/self._nu
         c_f = c_f_fun(Re_delta_m, H_d)
-        H1 = self._H1(H_d)
-        H1p = self._H1p(H_d)
-        Fp[0] = 0.5*c_f-delta_m*(2+H_d)*dU_edx/U_e
-        Fp[1] = (U_e*self._S(H1) - U_e*Fp[0]*H1
-                 - dU_edx*delta_m*H1)/(H1p*U_e*delta_m)
-        return Fp
+        H1, H1p = self._H1_and_H1p(H_d)
+        delta_mp = 0.5*c_f-delta_m*(2+H_d)*dU_edx/U_e
+        H_dp = (U_e*self._S(H1) - U_e*delta_mp*H1
+                - dU_edx*delta_m*H1)/(H1p*U_e*delta_m)
+        return np.array([delta_mp, H_dp])
+
+    @staticmethod
+    def _calc_rhs_scalar(delta_m, H_d, U_e, dU_edx, nu):
+        """
+        Calculate the right-hand side of the ODE for a single state.
+
+        This is the scalar version of :meth:`_calc_rhs` used by the ODE
+        solver. The shape factor relations are written out inline so that
+        each step is plain floating point arithmetic.
+
+        Parameters
+        ----------
+        delta_m: float
+            Momentum thickness.
+        H_d: float
+            Displacement shape factor.
+        U_e: float
+            Edge velocity.
+        dU_edx: float
+            Streamwise derivative of the edge velocity.
+        nu: float
+            Kinematic viscosity.
+
+        Returns
+        -------
+        2-Tuple
+            Streamwise rate of change of the momentum thickness
+            Streamwise rate of change of the displacement shape factor
+        """
+        # pylint: disable=too-many-arguments
+        H_d = max(H_d, 1.11)
+        if abs(U_e) < 0.001:
+            U_e = 0.001
+
+        c_f = c_f_fun(U_e*delta_m/nu, H_d)
+        # H1' shares the power term with H1, so only one pow is needed
+        H1_c = HeadMethod._H1_LOW if H_d <= 1.6 else HeadMethod._H1_HIGH
+        H_d_shift = H_d - H1_c[1]
+        H1_term = H1_c[0]/H_d_shift**H1_c[2]
+        H1 = H1_c[3] + H1_term
+        H1p = -H1_c[2]*H1_term/H_d_shift
+        S_c = HeadMethod._S_C
+        S = S_c[0]/(H1 - S_c[1])**S_c[2]
+
+        delta_mp = 0.5*c_f - delta_m*(2 + H_d)*dU_edx/U_e
+        H_dp = (U_e*S - U_e*delta_mp*H1 - dU_edx*delta_m*H1)/(H1p*U_e*delta_m)
+        return delta_mp, H_dp
+
+    def _solution_cached(self, x):
+        """
+        Return the ODE solution at the specified location(s).
+
+        The query methods are often called one after the other with the same
+        locations, so the most recent evaluation is kept and reused when the
+        locations and the solution have not changed. The returned array is
+        read-only since it is shared between calls.
+
+        Parameters
+        ----------
+        x: array-like
+            Streamwise loations to calculate the solution.
+
+        Returns
+        -------
+        array-like
+            Momentum thickness and displacement shape factor at `x`.
+        """
+        if ((self._sol_cache is not None)
+                and (self._sol_cache_src is self._solution)
+                and np.array_equal(self._x_cache, x)):
+            return self._sol_cache
+
+        sol = self._solution(x)
+        sol.setflags(write=False)
+        self._x_cache = np.array(x, copy=True)
+        self._sol_cache = sol
+        self._sol_cache_src = self._solution
+        return sol
 
     @staticmethod
     def _H1(H_d):
-        H_d = np.asarray(H_d)
-        if (H_d <= 1.1).any():
-            H_d[H_d <= 1.1] = 1.1001
+        H_d = np.where(np.asarray(H_d) <= 1.1, 1.1001, H_d)
 #            raise ValueError("Cannot pass displacement shape factor less "
 #                             "than 1.1: {}".format(np.amin(H_d)))
 
-        def H1_low(H_d):
-            a = 0.8234
-            b = 1.1
-            c = 1.287
-            d = 3.3
-            return d + a/(H_d - b)**c
-
-        def H1_high(H_d):
-            a = 1.5501
-            b = 0.6778
-            c = 3.064
-            d = 3.32254659218600974
-            return d + a/(H_d - b)**c
-
-        return np.piecewise(H_d, [H_d <= 1.6, H_d > 1.6], [H1_low, H1_high])
+        H1_c = HeadMethod._H1_LOW
+        H1_low = H1_c[3] + H1_c[0]/(H_d - H1_c[1])**H1_c[2]
+        H1_c = HeadMethod._H1_HIGH
+        H1_high = H1_c[3] + H1_c[0]/(H_d - H1_c[1])**H1_c[2]
+        return np.where(H_d <= 1.6, H1_low, H1_high)
 
     @staticmethod
     def _H1p(H_d):
-        H_d_local = np.asarray(H_d)
-        if (H_d_local <= 1.1).any():
-            H_d_local[H_d_local <= 1.1] = 1.1001
+        H_d_local = np.where(np.asarray(H_d) <= 1.1, 1.1001, H_d)
 #            raise ValueError("Cannot pass displacement shape factor less "
 #                             "than 1.1: {}".format(np.amin(H_d)))
 
-        def H1_low(H_d):
-            a = 0.8234
-            b = 1.1
-            c = 1.287
-            return -a*c/(H_d - b)**(c+1)
+        H1_c = HeadMethod._H1_LOW
+        H1p_low = -H1_c[0]*H1_c[2]/(H_d_local - H1_c[1])**(H1_c[2]+1)
+        H1_c = HeadMethod._H1_HIGH
+        H1p_high = -H1_c[0]*H1_c[2]/(H_d_local - H1_c[1])**(H1_c[2]+1)
+        return np.where(H_d_local <= 1.6, H1p_low, H1p_high)
 
-        def H1_high(H_d):
-            a = 1.5501
-            b = 0.6778
-            c = 3.064
-            return -a*c/(H_d - b)**(c+1)
-
-        return np.piecewise(H_d_local, [H_d_local <= 1.6, H_d_local > 1.6],
-                            [H1_low, H1_high])
+    @staticmethod
+    def _H1_and_H1p(H_d):
+        H_d = np.where(np.asarray(H_d) <= 1.1, 1.1001, H_d)
+
+        # both relations share the same power term, so pick constants for
+        # each interval and evaluate once
+        low = H_d <= 1.6
+        a, b, c, d = (np.where(low, lo, hi) for lo, hi
+                      in zip(HeadMethod._H1_LOW, HeadMethod._H1_HIGH))
+        H_d_shift = H_d - b
+        H1_term = a/H_d_shift**c
+        return d + H1_term, -c*H1_term/H_d_shift
 
     @staticmethod
     def _H_d(H1):
-        H1_local = np.asarray(H1)
-        if (H1_local <= 3.32254659218600974).any():
-            H1_local[H1_local <= 3.32254659218600974] = 3.323
+        H1_break = HeadMethod._H1_BREAK
+        H1_local = np.where(np.asarray(H1) <= 3.32254659218600974, 3.323, H1)
 #            raise ValueError("Cannot pass entrainment shape factor less "
 #                             "than 3.323: {}".format(np.amin(H1)))
 
-        def H_d_low(H1):
-            a = 1.5501
-            b = 0.6778
-            c = 3.064
-            d = 3.32254659218600974
-            return b + (a/(H1 - d))**(1/c)
-
-        def H_d_high(H1):
-            a = 0.8234
-            b = 1.1
-            c = 1.287
-            d = 3.3
-            return b + (a/(H1 - d))**(1/c)
-
-        H1_break = HeadMethod._H1(1.6)
-        return np.piecewise(H1_local, [H1_local <= H1_break,
-                                       H1_local > H1_break],
-                            [H_d_low, H_d_high])
+        H1_c = HeadMethod._H1_HIGH
+        H_d_low = H1_c[1] + (H1_c[0]/(H1_local - H1_c[3]))**(1/H1_c[2])
+        H1_c = HeadMethod._H1_LOW
+        H_d_high = H1_c[1] + (H1_c[0]/(H1_local - H1_c[3]))**(1/H1_c[2])
+        return np.where(H1_local <= H1_break, H_d_low, H_d_high)
 
     @staticmethod
     def _S(H1):
-        H1_local = np.asarray(H1, float)
-        if (H1_local <= 3).any():
-            H1_local[H1_local <= 3] = 3.001
+        a, b, c = HeadMethod._S_C
+        H1_local = np.where(np.asarray(H1) <= 3, 3.001, H1)
 #            raise ValueError("Cannot pass entrainment shape factor less than "
 #                             " 3: {}".format(np.amin(H1)))
-        return 0.0306/(H1_local-3)**0.6169
+        return a/(H1_local - b)**c
 
 
 class _HeadSeparationEvent(IBLTermEvent):
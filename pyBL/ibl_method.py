@@ -15,15 +15,18 @@ All integral boundary layer method classes return an instance of
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Tuple
 import numpy as np
 import numpy.typing as np_type
-from scipy.interpolate import PchipInterpolator
+from scipy.interpolate import PPoly
 from scipy.integrate import solve_ivp
-from scipy.misc import derivative as fd
 
 from pyBL.initial_condition import InitialCondition
 from pyBL.initial_condition import FalknerSkanStagnationCondition
+from pyBL.ibl_utilities import float_str, velocity_functions
 
 
 TERMINATION_MESSAGES = {0: "Completed",
@@ -32,6 +35,7 @@ TERMINATION_MESSAGES = {0: "Completed",
                         -99: "Unknown Event"}
 
 
+@dataclass(frozen=True, eq=False)
 class IBLResult:
     """
     Bunch object representing the results of the IBL integration.
@@ -64,14 +68,11 @@ class IBLResult:
     """
 
     # pylint: disable=too-few-public-methods
-    def __init__(self, x_end=np.inf, F_end=np.inf, status=-99,
-                 message="Not Set", success=False):
-        # pylint: disable=too-many-arguments
-        self.x_end = x_end
-        self.F_end = F_end
-        self.status = status
-        self.message = message
-        self.success = success
+    x_end: float = np.inf
+    F_end: np_type.ArrayLike = np.inf
+    status: int = -99
+    message: str = "Not Set"
+    success: bool = False
 
     def __str__(self):
         """
@@ -82,14 +83,21 @@ class IBLResult:
         string
             Readable string representation of instance.
         """
-        strout = f"{self.__class__.__name__}:\n"
-        strout += f"    x_end: {self.x_end}\n"
-        strout += f"    F_end: {self.F_end}\n"
-        strout += f"    status: {self.status}\n"
-        strout += f"    message: {self.message}\n"
-        strout += f"    success: {self.success}"
-
-        return strout
+        # NOTE: Floats in arrays are formatted individually to eight
+        #       significant digits on one line so that short arrays print the
+        #       same as lists of the same values.
+        if isinstance(self.F_end, np.ndarray) and self.F_end.ndim >= 1:
+            F_end = np.array2string(self.F_end, separator=", ",
+                                    max_line_width=np.inf,
+                                    formatter={"float_kind": float_str})
+        else:
+            F_end = f"{self.F_end}"
+        return (f"{self.__class__.__name__}:\n"
+                f"    x_end: {self.x_end}\n"
+                f"    F_end: {F_end}\n"
+                f"    status: {self.status}\n"
+                f"    message: {self.message}\n"
+                f"    success: {self.success}")
 
 
 class IBLMethod(ABC):
@@ -124,6 +132,13 @@ class IBLMethod(ABC):
           monotonic cubic spline will be created and the derivative functions
           will be taken from the cubic spline.
 
+        - `U_e` and `dU_edx` can both be 2-tuples of the same xpoints and the
+          velocity and rate of change of velocity values, respectively.
+
+          In this case a cubic Hermite spline will be created that matches
+          both the velocity and its derivative at the xpoints. The derivative
+          functions will be taken from the cubic spline.
+
         - `U_e` can be a scalar and `dU_edx` is a 2-tuple of xpoints and rates
           of change of velocity values.
 
@@ -161,6 +176,7 @@ class IBLMethod(ABC):
         When configuration parameter is invalid (see message).
     """
 
+    # pylint: disable=too-many-instance-attributes
     # Attributes
     # ----------
     # _U_e: Callable
@@ -178,8 +194,12 @@ class IBLMethod(ABC):
     # _solution: vector of callables
     #     Piecewise polynomials representing the state variables from the ODE
     #     solution.
+    # _scalar_velocity_cache: 2-tuple
+    #     Edge velocity functions and the scalar evaluators created from them.
     def __init__(self, nu: float, U_e=None, dU_edx=None, d2U_edx2=None,
                  ic=None):
+        self._scalar_velocity_cache = None
+
         # set the velocity terms
         if U_e is None:
             if dU_edx is not None:
@@ -251,91 +271,42 @@ class IBLMethod(ABC):
         ValueError
             When configuration parameter is invalid (see message).
         """
-        # pylint: disable=too-many-branches
-        # pylint: disable=too-many-statements
-
-        # check if U_e is callable
-        if callable(U_e):
-            self._U_e = U_e
-
-            # if dU_edx not provided then use finite differences
-            if dU_edx is None:
-                if d2U_edx2 is not None:
-                    raise ValueError("Can only pass second derivative if "
-                                     "first derivative was specified")
-
-                # if U_e has derivative method then use it
-                if (hasattr(U_e, "derivative")
-                        and callable(getattr(U_e, "derivative"))):
-                    self._dU_edx = U_e.derivative()
-                    self._d2U_edx2 = U_e.derivative(2)
-                else:
-                    self._dU_edx = lambda x: fd(self._U_e, x, 1e-4,
-                                                n=1, order=3)
-                    self._d2U_edx2 = lambda x: fd(self._U_e, x, 1e-4,
-                                                  n=2, order=3)
-            else:
-                if not callable(dU_edx):
-                    raise ValueError("Must pass in callable object for first "
-                                     "derivative if callable U_e given")
-                self._dU_edx = dU_edx
-
-                # if d2U_edx2 not provied then use finite difference
-                if d2U_edx2 is None:
-                    # if dU_edx has derivative method then use it
-                    if (hasattr(dU_edx, "derivative")
-                            and callable(getattr(dU_edx, "derivative"))):
-                        self._d2U_edx2 = dU_edx.derivative()
-                    else:
-                        self._d2U_edx2 = lambda x: fd(self._dU_edx, x, 1e-5,
-                                                      n=1, order=3)
-                else:
-                    if not callable(dU_edx):
-                        raise ValueError("Must pass in callable object for "
-                                         "first derivative if callable U_e "
-                                         "given")
-
-                    self._d2U_edx2 = d2U_edx2
-        elif isinstance(U_e, (int, float)):
-            # if is 2-tuple then assume x, dU_edx pairs to build spline
-            if len(dU_edx) == 2:
-                x_pts = np.asarray(dU_edx[0])
-                dU_edx_pts = np.asarray(dU_edx[1])
-                self._dU_edx = PchipInterpolator(x_pts, dU_edx_pts)
-                self._U_e = self._dU_edx.antiderivative()
-                self._U_e.c[-1, :] = self._U_e.c[-1, :] + U_e
-                self._d2U_edx2 = self._dU_edx.derivative()
-            else:
-                # otherwise unknown velocity input
-                raise ValueError(f"Don't know how to use {dU_edx} to "
-                                 "initialize velocity derivative")
-        else:
-            # if is 2-tuple then assume x, U_e pairs to build spline
-            if len(U_e) == 2:
-                x_pts = np.asarray(U_e[0])
-                U_e_pts = np.asarray(U_e[1])
-                npts = x_pts.shape[0]
-                # check to make sure have two vectors of same length suitable
-                #   for building splines
-                if x_pts.ndim != 1:
-                    raise ValueError("First element of U_e 2-tuple must be 1D "
-                                     "vector of distances")
-                if U_e_pts.ndim != 1:
-                    raise ValueError("Second element of U_e 2-tuple must be "
-                                     "1D vector of Velocities")
-                if npts != U_e_pts.shape[0]:
-                    raise ValueError("Vectors in U_e 2-tuple must be of same "
-                                     "length")
-                if npts < 2:
-                    raise ValueError("Must pass at least two points for edge "
-                                     "velocity")
-
-                U_e_spline = PchipInterpolator(x_pts, U_e_pts)
-                self.set_velocity(U_e_spline)
-            else:
-                # otherwise unknown velocity input
-                raise ValueError(f"Don't know how to use {U_e} to initialize "
-                                 "velocity")
+        self._U_e, self._dU_edx, self._d2U_edx2 = velocity_functions(
+            U_e, dU_edx, d2U_edx2)
+
+    @staticmethod
+    def velocity_only(U_e, dU_edx=None, d2U_edx2=None) -> SimpleNamespace:
+        """
+        Return the edge velocity relations without an IBL method.
+
+        This builds the same velocity functions as :meth:`set_velocity` for
+        cases where only the edge velocity is needed.
+
+        Parameters
+        ----------
+        U_e : 2-tuple of array-like, scalar, or function-like
+            Representation of the edge velocity.
+        dU_edx : None, 2-tuple of array-like, or function-like, optional
+            Representation of the first derivative of the edge velocity. The
+            default is `None`.
+        d2U_edx2 : None or function-like, optional
+            Representation of the second derivative of the edge velocity. The
+            default is `None`.
+
+        Returns
+        -------
+        SimpleNamespace
+            Object with callable `U_e`, `dU_edx`, and `d2U_edx2` attributes.
+
+        Raises
+        ------
+        ValueError
+            When configuration parameter is invalid (see message).
+        """
+        U_e_fun, dU_edx_fun, d2U_edx2_fun = velocity_functions(U_e, dU_edx,
+                                                               d2U_edx2)
+        return SimpleNamespace(U_e=U_e_fun, dU_edx=dU_edx_fun,
+                               d2U_edx2=d2U_edx2_fun)
 
     def solve(self, x0: float, x_end: float, term_event=None) -> IBLResult:
         r"""
@@ -500,6 +471,115 @@ class IBLMethod(ABC):
             raise ValueError("d2U_edx2 was not set")
         return self._d2U_edx2(x)
 
+    def _velocity_terms(self, x):
+        """
+        Return the edge velocity and its first two derivatives together.
+
+        When the edge velocity and its derivatives are piecewise polynomials
+        on the same breakpoints (such as splines created from points and
+        their derivatives) the interval of each location is found once and
+        shared by all three terms. Otherwise each term is evaluated
+        separately.
+
+        Parameters
+        ----------
+        x: array-like
+            Streamwise loations to calculate the terms.
+
+        Returns
+        -------
+        3-Tuple
+            Inviscid edge velocity
+            Derivative of inviscid edge velocity
+            Second derivative of inviscid edge velocity
+        """
+        funs = (self._U_e, self._dU_edx, self._d2U_edx2)
+        if (all(isinstance(fun, PPoly) and (fun.c.ndim == 2)
+                and (fun.extrapolate is True) for fun in funs)
+                and (funs[1].x is funs[0].x) and (funs[2].x is funs[0].x)
+                and (funs[0].x[-1] > funs[0].x[0])):
+            x = np.asarray(x, dtype=float)
+            breaks = funs[0].x
+            # out of range values extrapolate from the end intervals
+            i = np.clip(np.searchsorted(breaks, x, side="right") - 1, 0,
+                        breaks.shape[0] - 2)
+            dx = x - breaks[i]
+            terms = []
+            for fun in funs:
+                val = fun.c[0, i]
+                for ck in fun.c[1:]:
+                    val = val*dx + ck[i]
+                terms.append(val)
+            return terms[0], terms[1], terms[2]
+
+        return self.U_e(x), self.dU_edx(x), self.d2U_edx2(x)
+
+    def _scalar_velocity(self):
+        """
+        Return scalar evaluators for the edge velocity and its derivative.
+
+        The evaluators are reused as long as the edge velocity functions have
+        not been replaced, so repeated solves with the same edge velocity
+        (such as when changing the initial conditions) only create them once.
+
+        Returns
+        -------
+        2-Tuple
+            Scalar evaluator of the edge velocity
+            Scalar evaluator of the streamwise derivative of edge velocity
+        """
+        funs = (self._U_e, self._dU_edx)
+        cache = self._scalar_velocity_cache
+        if ((cache is None) or (cache[0][0] is not funs[0])
+                or (cache[0][1] is not funs[1])):
+            cache = (funs, (self._scalar_evaluator(funs[0]),
+                            self._scalar_evaluator(funs[1])))
+            self._scalar_velocity_cache = cache
+        return cache[1]
+
+    @staticmethod
+    def _scalar_evaluator(fun):
+        """
+        Create a version of a function that is fast for scalar arguments.
+
+        The ODE solver evaluates the edge velocity terms at one location at a
+        time, where the overhead of calling the interpolating splines
+        dominates. For piecewise polynomials (such as the splines created from
+        points) the interval is found with a bisection on the breakpoints and
+        the polynomial is evaluated directly with Python floats, which gives
+        the same values as the spline. Any other function is simply called.
+
+        Parameters
+        ----------
+        fun: callable
+            Function of one location to be evaluated.
+
+        Returns
+        -------
+        callable
+            Function taking a float location and returning a float.
+        """
+        if (isinstance(fun, PPoly) and (fun.c.ndim == 2)
+                and (fun.extrapolate is True) and (fun.x[-1] > fun.x[0])):
+            breaks = fun.x.tolist()
+            coefs = fun.c.T.tolist()
+            i_max = len(breaks) - 2
+
+            def scalar_fun(x):
+                # out of range values extrapolate from the end intervals
+                i = min(max(bisect_right(breaks, x) - 1, 0), i_max)
+                dx = x - breaks[i]
+                c = coefs[i]
+                val = c[0]
+                for ck in c[1:]:
+                    val = val*dx + ck
+                return val
+        else:
+            def scalar_fun(x):
+                return float(fun(x))
+
+        return scalar_fun
+
     def _add_kill_event(self, ke):
         """
         Add kill event to the ODE solver.
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Utility functions shared by the integral boundary layer method classes.
+
+This module provides the construction of the edge velocity relations used by
+:class:`pyBL.ibl_method.IBLMethod`, simple finite difference approximations,
+and formatting helpers.
+"""
+
+from functools import partial
+import numpy as np
+from scipy.interpolate import CubicHermiteSpline, PchipInterpolator
+
+
+def float_str(value):
+    """
+    Return the string of a float rounded to eight significant digits.
+
+    Parameters
+    ----------
+    value: float
+        Value to format.
+
+    Returns
+    -------
+    string
+        Formatted value in the same form as Python floats.
+    """
+    return str(float(f"{value:.8g}"))
+
+
+def fd1(fun, x, h):
+    """
+    Approximate the first derivative using central differences.
+
+    Parameters
+    ----------
+    fun: callable
+        Function to differentiate.
+    x: array-like
+        Locations to calculate the derivative.
+    h: float
+        Spacing of the finite difference.
+
+    Returns
+    -------
+    array-like same shape as `x`
+        Approximate first derivative at the specified locations.
+    """
+    x = np.asarray(x)
+    return (fun(x + h) - fun(x - h))/(2*h)
+
+
+def fd2(fun, x, h):
+    """
+    Approximate the second derivative using central differences.
+
+    Parameters
+    ----------
+    fun: callable
+        Function to differentiate.
+    x: array-like
+        Locations to calculate the derivative.
+    h: float
+        Spacing of the finite difference.
+
+    Returns
+    -------
+    array-like same shape as `x`
+        Approximate second derivative at the specified locations.
+    """
+    x = np.asarray(x)
+    return (fun(x + h) - 2*fun(x) + fun(x - h))/(h*h)
+
+
+def velocity_functions(U_e, dU_edx=None, d2U_edx2=None):
+    """
+    Return the edge velocity and its derivatives as callable objects.
+
+    See :meth:`pyBL.ibl_method.IBLMethod.set_velocity` for the supported
+    arguments.
+
+    Returns
+    -------
+    3-tuple of callables
+        Edge velocity, its first derivative, and its second derivative.
+
+    Raises
+    ------
+    ValueError
+        When configuration parameter is invalid (see message).
+    """
+    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-statements
+
+    # check if U_e is callable
+    if callable(U_e):
+        U_e_fun = U_e
+
+        # if dU_edx not provided then use finite differences
+        if dU_edx is None:
+            if d2U_edx2 is not None:
+                raise ValueError("Can only pass second derivative if "
+                                 "first derivative was specified")
+
+            # if U_e has derivative method then use it
+            if (hasattr(U_e, "derivative")
+                    and callable(getattr(U_e, "derivative"))):
+                dU_edx_fun = U_e.derivative()
+                d2U_edx2_fun = U_e.derivative(2)
+            else:
+                dU_edx_fun = partial(fd1, U_e_fun, h=1e-4)
+                d2U_edx2_fun = partial(fd2, U_e_fun, h=1e-4)
+        else:
+            if not callable(dU_edx):
+                raise ValueError("Must pass in callable object for first "
+                                 "derivative if callable U_e given")
+            dU_edx_fun = dU_edx
+
+            # if d2U_edx2 not provied then use finite difference
+            if d2U_edx2 is None:
+                # if dU_edx has derivative method then use it
+                if (hasattr(dU_edx, "derivative")
+                        and callable(getattr(dU_edx, "derivative"))):
+                    d2U_edx2_fun = dU_edx.derivative()
+                else:
+                    d2U_edx2_fun = partial(fd1, dU_edx_fun, h=1e-5)
+            else:
+                if not callable(dU_edx):
+                    raise ValueError("Must pass in callable object for "
+                                     "first derivative if callable U_e "
+                                     "given")
+
+                d2U_edx2_fun = d2U_edx2
+    elif isinstance(U_e, (int, float)):
+        # if is 2-tuple then assume x, dU_edx pairs to build spline
+        if len(dU_edx) == 2:
+            x_pts = np.asarray(dU_edx[0])
+            dU_edx_pts = np.asarray(dU_edx[1])
+            dU_edx_fun = PchipInterpolator(x_pts, dU_edx_pts)
+            U_e_fun = dU_edx_fun.antiderivative()
+            U_e_fun.c[-1, :] = U_e_fun.c[-1, :] + U_e
+            d2U_edx2_fun = dU_edx_fun.derivative()
+        else:
+            # otherwise unknown velocity input
+            raise ValueError(f"Don't know how to use {dU_edx} to "
+                             "initialize velocity derivative")
+    else:
+        # if is 2-tuple then assume x, U_e pairs to build spline
+        if len(U_e) == 2:
+            x_pts = np.asarray(U_e[0])
+            U_e_pts = np.asarray(U_e[1])
+            npts = x_pts.shape[0]
+            # check to make sure have two vectors of same length suitable
+            #   for building splines
+            if x_pts.ndim != 1:
+                raise ValueError("First element of U_e 2-tuple must be 1D "
+                                 "vector of distances")
+            if U_e_pts.ndim != 1:
+                raise ValueError("Second element of U_e 2-tuple must be "
+                                 "1D vector of Velocities")
+            if npts != U_e_pts.shape[0]:
+                raise ValueError("Vectors in U_e 2-tuple must be of same "
+                                 "length")
+            if npts < 2:
+                raise ValueError("Must pass at least two points for edge "
+                                 "velocity")
+
+            # NOTE: Derivative points are only used when given as 2-tuple,
+            #       other derivative representations are ignored.
+            if not (isinstance(dU_edx, (tuple, list)) and len(dU_edx) == 2):
+                U_e_spline = PchipInterpolator(x_pts, U_e_pts)
+            else:
+                if d2U_edx2 is not None:
+                    raise ValueError("Cannot pass second derivative with "
+                                     "U_e and dU_edx points")
+                if not np.array_equal(np.asarray(dU_edx[0]), x_pts):
+                    raise ValueError("Distances in U_e and dU_edx "
+                                     "2-tuples must be the same")
+                dU_edx_pts = np.asarray(dU_edx[1])
+                if dU_edx_pts.shape != U_e_pts.shape:
+                    raise ValueError("Vectors in dU_edx 2-tuple must be "
+                                     "of same length")
+                U_e_spline = CubicHermiteSpline(x_pts, U_e_pts,
+                                                dU_edx_pts)
+            return velocity_functions(U_e_spline)
+
+        # otherwise unknown velocity input
+        raise ValueError(f"Don't know how to use {U_e} to initialize "
+                         "velocity")
+
+    return U_e_fun, dU_edx_fun, d2U_edx2_fun
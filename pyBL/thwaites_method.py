@@ -12,17 +12,24 @@ assumption and provides slightly better results in all cases tested.
 """
 
 from abc import abstractmethod
+from bisect import bisect_right
+import math
 from typing import Tuple
 import numpy as np
 import numpy.typing as np_type
 from scipy.interpolate import CubicSpline
-from scipy.misc import derivative as fd
 
 from pyBL.ibl_method import IBLMethod
 from pyBL.ibl_method import IBLTermEvent
+from pyBL.ibl_utilities import fd1
 from pyBL.initial_condition import ManualCondition
 
 
+# Coefficients of the linear approximation F = _A - _B*lambda
+_A = 0.45
+_B = 6.0
+
+
 class ThwaitesMethod(IBLMethod):
     """
     Base class for Thwaites' Method.
@@ -128,7 +135,7 @@ class ThwaitesMethod(IBLMethod):
                 elif len(data_fits) == 2:
                     if callable(data_fits[0]) and callable(data_fits[1]):
                         def Hp_fun(lam):
-                            return fd(self._model.H, lam, 1e-5, n=1, order=3)
+                            return fd1(self._model.H, lam, 1e-5)
                         self._model = _ThwaitesFunctions("Custom",
                                                          data_fits[0],
                                                          data_fits[1],
@@ -160,16 +167,18 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `x`
             Desired transpiration velocity at the specified locations.
         """
-        U_e = self.U_e(x)
-        dU_edx = self.dU_edx(x)
+        x = np.asarray(x, dtype=float)
+        U_e, dU_edx, d2U_edx2 = self._velocity_terms(x)
         delta_m2_on_nu = self._solution(x)[0]
-        term1 = dU_edx*self.delta_d(x)
+        lam = delta_m2_on_nu*dU_edx
+        H_d = self._model.H(lam)
+        delta_d = np.sqrt(delta_m2_on_nu*self._nu)*H_d
+        term1 = dU_edx*delta_d
         term2 = np.sqrt(self._nu/delta_m2_on_nu)
-        dsol_dx = self._ode_impl(x, delta_m2_on_nu)
-        term3 = 0.5*U_e*self.H_d(x)*dsol_dx
-        term4a = self._model.Hp(self._calc_lambda(x, delta_m2_on_nu))
-        term4 = U_e*delta_m2_on_nu*term4a
-        term5 = dU_edx*dsol_dx+self.d2U_edx2(x)*delta_m2_on_nu
+        dsol_dx = self._calc_rhs(delta_m2_on_nu, U_e, dU_edx)
+        term3 = 0.5*U_e*H_d*dsol_dx
+        term4 = U_e*delta_m2_on_nu*self._model.Hp(lam)
+        term5 = dU_edx*dsol_dx+d2U_edx2*delta_m2_on_nu
         return term1 + term2*(term3+term4*term5)
 
     def delta_d(self, x):
@@ -202,6 +211,7 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `x`
             Desired momentum thickness at the specified locations.
         """
+        x = np.asarray(x, dtype=float)
         return np.sqrt(self._solution(x)[0]*self._nu)
 
     def delta_k(self, x):
@@ -218,7 +228,7 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `x`
             Desired kinetic energy thickness at the specified locations.
         """
-        return np.zeros_like(x)
+        return np.zeros(np.shape(x))
 
     def H_d(self, x):
         """
@@ -234,6 +244,7 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `x`
             Desired displacement shape factor at the specified locations.
         """
+        x = np.asarray(x, dtype=float)
         lam = self._calc_lambda(x, self._solution(x)[0])
         return self._model.H(lam)
 
@@ -269,6 +280,7 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `x`
             Desired wall shear stress at the specified locations.
         """
+        x = np.asarray(x, dtype=float)
         lam = self._calc_lambda(x, self._solution(x)[0])
         return rho*self._nu*self.U_e(x)*self._model.S(lam)/self.delta_m(x)
 
@@ -288,7 +300,43 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `x`
             Desired dissipation integral at the specified locations.
         """
-        return np.zeros_like(x)
+        return np.zeros(np.shape(x))
+
+    def evaluate_all(self, x, rho=None):
+        """
+        Calculate the boundary layer properties together.
+
+        The solution, edge velocity, and fit functions are evaluated once and
+        shared among the properties, which is less work than calling each of
+        the property methods separately.
+
+        Parameters
+        ----------
+        x: array-like
+            Streamwise loations to calculate the properties.
+        rho: float, optional
+            Freestream density. If not provided then the wall shear stress is
+            not calculated.
+
+        Returns
+        -------
+        dict
+            Momentum thickness, displacement thickness, displacement shape
+            factor, and wall shear stress at the specified locations keyed by
+            "delta_m", "delta_d", "H_d", and "tau_w". The wall shear stress is
+            `None` when `rho` is not provided.
+        """
+        x = np.asarray(x, dtype=float)
+        delta_m2_on_nu = self._solution(x)[0]
+        lam = delta_m2_on_nu*self.dU_edx(x)
+        S, H_d = self._model.S_and_H(lam)
+        delta_m = np.sqrt(delta_m2_on_nu*self._nu)
+        if rho is None:
+            tau_w = None
+        else:
+            tau_w = rho*self._nu*self.U_e(x)*S/delta_m
+        return {"delta_m": delta_m, "delta_d": delta_m*H_d, "H_d": H_d,
+                "tau_w": tau_w}
 
     def _ode_setup(self) -> Tuple[np_type.NDArray, float, float]:
         """
@@ -320,7 +368,14 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `F`
             The right-hand side of the ODE at the given state.
         """
-        return self._calc_F(x, F)/(1e-3 + self.U_e(x))
+        if np.isscalar(x):
+            # solver passes scalar location, so avoid array overhead
+            x = float(x)
+            U_e_fun, dU_edx_fun = self._scalar_velocity()
+            return np.array([self._calc_rhs(float(F[0]), U_e_fun(x),
+                                            dU_edx_fun(x))])
+
+        return self._calc_rhs(F, self.U_e(x), self.dU_edx(x))
 
     def _calc_lambda(self, x, delta_m2_on_nu):
         r"""
@@ -338,29 +393,28 @@ class ThwaitesMethod(IBLMethod):
         array-like same shape as `x`
             The :math:`\lambda` parameter that corresponds to the given state.
         """
+        if np.isscalar(x):
+            return delta_m2_on_nu*self._scalar_velocity()[1](float(x))
         return delta_m2_on_nu*self.dU_edx(x)
 
     @abstractmethod
-    def _calc_F(self, x, delta_m2_on_nu):
+    def _calc_rhs(self, delta_m2_on_nu, U_e, dU_edx):
         """
-        Calculate the :math:`F` term in the ODE.
-
-        The F term captures the interaction between the shear function and the
-        shape function and can be modeled as a linear expression (as the
-        standard Thwaites' method does) or can be calculated directly using
-        the data fit relations for the shear function and the shape function.
+        Calculate the right-hand side of the ODE from known edge velocity.
 
         Parameters
         ----------
-        x : array-like
-            Streamwise location of current step.
         delta_m2_on_nu : array-like
             Dependent variable in the ODE solver.
+        U_e : array-like
+            Edge velocity at current step.
+        dU_edx : array-like
+            Streamwise derivative of edge velocity at current step.
 
         Returns
         -------
-        array-like same shape as `x`
-            The calculated value of :math:`F`
+        array-like same shape as `delta_m2_on_nu`
+            The right-hand side of the ODE at the given state.
         """
 
 
@@ -392,6 +446,9 @@ class ThwaitesMethodLinear(ThwaitesMethod):
 
         .. math:: F\left(\lambda\right)=0.45-6\lambda
 
+        This is not used by the ODE solver, which evaluates the right-hand
+        side through :meth:`_calc_rhs`.
+
         Parameters
         ----------
         x : array-like
@@ -405,9 +462,27 @@ class ThwaitesMethodLinear(ThwaitesMethod):
             The calculated value of :math:`F`
         """
         lam = self._calc_lambda(x, delta_m2_on_nu)
-        a = 0.45
-        b = 6
-        return a - b*lam
+        return _A - _B*lam
+
+    def _calc_rhs(self, delta_m2_on_nu, U_e, dU_edx):
+        """
+        Calculate the right-hand side of the ODE from known edge velocity.
+
+        Parameters
+        ----------
+        delta_m2_on_nu : array-like
+            Dependent variable in the ODE solver.
+        U_e : array-like
+            Edge velocity at current step.
+        dU_edx : array-like
+            Streamwise derivative of edge velocity at current step.
+
+        Returns
+        -------
+        array-like same shape as `delta_m2_on_nu`
+            The right-hand side of the ODE at the given state.
+        """
+        return _rhs_linear(delta_m2_on_nu*dU_edx, U_e)
 
 
 class ThwaitesMethodNonlinear(ThwaitesMethod):
@@ -440,6 +515,9 @@ class ThwaitesMethodNonlinear(ThwaitesMethod):
 
         .. math:: F\left(\lambda\right)=2\left[S-\lambda\left(H+2\right)\right]
 
+        This is not used by the ODE solver, which evaluates the right-hand
+        side through :meth:`_calc_rhs`.
+
         Parameters
         ----------
         x : array-like
@@ -455,17 +533,141 @@ class ThwaitesMethodNonlinear(ThwaitesMethod):
         lam = self._calc_lambda(x, delta_m2_on_nu)
         return self._model.F(lam)
 
+    def _calc_rhs(self, delta_m2_on_nu, U_e, dU_edx):
+        """
+        Calculate the right-hand side of the ODE from known edge velocity.
+
+        Parameters
+        ----------
+        delta_m2_on_nu : array-like
+            Dependent variable in the ODE solver.
+        U_e : array-like
+            Edge velocity at current step.
+        dU_edx : array-like
+            Streamwise derivative of edge velocity at current step.
+
+        Returns
+        -------
+        array-like same shape as `delta_m2_on_nu`
+            The right-hand side of the ODE at the given state.
+        """
+        lam = delta_m2_on_nu*dU_edx
+        S, H = self._model.S_and_H(lam)
+        return _rhs_nonlinear(lam, U_e, S, H)
+
+
+def _rhs_linear(lam, U_e):
+    r"""
+    Calculate the right-hand side of the linear Thwaites ODE.
+
+    Parameters
+    ----------
+    lam : array-like
+        Thwaites' :math:`\lambda` parameter.
+    U_e : array-like
+        Edge velocity.
+
+    Returns
+    -------
+    array-like
+        The right-hand side of the ODE.
+    """
+    return (_A - _B*lam)/(1e-3 + U_e)
+
+
+def _rhs_nonlinear(lam, U_e, S, H):
+    r"""
+    Calculate the right-hand side of the nonlinear Thwaites ODE.
+
+    Parameters
+    ----------
+    lam : array-like
+        Thwaites' :math:`\lambda` parameter.
+    U_e : array-like
+        Edge velocity.
+    S : array-like
+        Shear function evaluated at `lam`.
+    H : array-like
+        Shape function evaluated at `lam`.
+
+    Returns
+    -------
+    array-like
+        The right-hand side of the ODE.
+    """
+    return 2*(S - lam*(H + 2))/(1e-3 + U_e)
+
+
+def _piecewise_poly_evaluator(fun):
+    """
+    Create an evaluator for a piecewise polynomial from its coefficients.
+
+    Calling the spline objects has a large overhead for the small number of
+    values needed by the ODE solver, so the interval is found directly from
+    the breakpoints and the polynomial is evaluated with Horner's method.
+    Values outside of the breakpoints are extrapolated from the end
+    intervals.
+
+    Parameters
+    ----------
+    fun: PPoly
+        Piecewise polynomial to evaluate. If it represents several functions
+        (coefficients with a third dimension) they are evaluated together
+        with a single interval search.
+
+    Returns
+    -------
+    callable
+        Function taking lambda values and returning the polynomial values,
+        or a tuple of the values of each function.
+    """
+    breaks = np.ascontiguousarray(fun.x, dtype=float)
+    # coefficients are stored as (order, interval, function)
+    coefs = np.ascontiguousarray(np.reshape(fun.c, fun.c.shape[:2] + (-1,)),
+                                 dtype=float)
+    breaks_list = breaks.tolist()
+    coefs_list = np.transpose(coefs, (2, 1, 0)).tolist()
+    i_max = breaks.shape[0] - 2
+    single = fun.c.ndim == 2
+
+    def evaluator(lam):
+        if isinstance(lam, float):
+            i = min(max(bisect_right(breaks_list, lam) - 1, 0), i_max)
+            dlam = lam - breaks_list[i]
+            vals = []
+            for cf in coefs_list:
+                c = cf[i]
+                val = c[0]
+                for ck in c[1:]:
+                    val = val*dlam + ck
+                vals.append(val)
+            return vals[0] if single else tuple(vals)
+
+        lam = np.asarray(lam, dtype=float)
+        i = np.clip(np.searchsorted(breaks, lam, side="right") - 1, 0, i_max)
+        dlam = lam[..., np.newaxis] - breaks[i][..., np.newaxis]
+        val = coefs[0, i]
+        for ck in coefs[1:]:
+            val = val*dlam + ck[i]
+        return val[..., 0] if single else tuple(np.moveaxis(val, -1, 0))
+
+    return evaluator
+
 
 class _ThwaitesFunctions:
     """Base class for curve fits for Thwaites data."""
 
-    def __init__(self, name, S_fun, H_fun, Hp_fun, lambda_min, lambda_max):
+    __slots__ = ("_range", "_name", "_H_fun", "_Hp_fun", "_S_fun", "_SH_fun")
+
+    def __init__(self, name, S_fun, H_fun, Hp_fun, lambda_min, lambda_max,
+                 SH_fun=None):
         # pylint: disable=too-many-arguments
         self._range = [lambda_min, lambda_max]
         self._name = name
         self._H_fun = H_fun
         self._Hp_fun = Hp_fun
         self._S_fun = S_fun
+        self._SH_fun = SH_fun
 
     def range(self):
         """Return a 2-tuple for the start and end of range."""
@@ -483,35 +685,40 @@ class _ThwaitesFunctions:
         """Return the S term."""
         return self._S_fun(self._check_range(lam))
 
+    def S_and_H(self, lam):
+        """Return the S and H terms."""
+        lam_local = self._check_range(lam)
+        if self._SH_fun is None:
+            return self._S_fun(lam_local), self._H_fun(lam_local)
+        return self._SH_fun(lam_local)
+
     def F(self, lam):
         """Return the F term."""
-        return 2*(self.S(lam) - lam*(self.H(lam)+2))
+        S, H = self.S_and_H(lam)
+        return 2*(S - lam*(H+2))
 
     def get_name(self):
         """Return name of function set."""
         return self._name
 
     def _check_range(self, lam):
-        lam_min, lam_max = self.range()
-        lam_local = np.array(lam)
-
-        if (lam_local < lam_min).any():
-            lam_local[lam_local < lam_min] = lam_min
-#            raise ValueError("Cannot pass value less than {} into this "
-#                             "function: {}".format(lam_min, lam))
-        elif (lam_local > lam_max).any():
-            lam_local[lam_local > lam_max] = lam_max
-#            raise ValueError("Cannot pass value greater than {} into this "
-#                             "function: {}".format(lam_max, lam))
-        return lam_local
+        # NOTE: Values outside of the range are clamped to the range
+        #       instead of raising an error.
+        if isinstance(lam, float):
+            return float(min(max(lam, self._range[0]), self._range[1]))
+        return np.clip(np.asarray(lam), self._range[0], self._range[1])
 
 
 class _ThwaitesFunctionsWhite(_ThwaitesFunctions):
     """Returns White's calculation of Thwaites functions."""
 
+    __slots__ = ()
+
     def __init__(self):
         def S(lam):
-            return pow(lam + 0.09, 0.62)
+            if isinstance(lam, float):
+                return math.pow(lam + 0.09, 0.62)
+            return np.power(np.add(lam, 0.09), 0.62)
 
         def H(lam):
             z = 0.25 - lam
@@ -527,26 +734,40 @@ class _ThwaitesFunctionsWhite(_ThwaitesFunctions):
 class _ThwaitesFunctionsCebeciBradshaw(_ThwaitesFunctions):
     """Returns Cebeci and Bradshaw's calculation of Thwaites functions."""
 
+    __slots__ = ()
+
     def __init__(self):
         def S(lam):
-            return np.piecewise(lam, [lam < 0, lam >= 0],
-                                [lambda lam: (0.22 + 1.402*lam
-                                              + 0.018*lam/(0.107 + lam)),
-                                 lambda lam: 0.22 + 1.57*lam - 1.8*lam**2])
+            if isinstance(lam, (int, float)):
+                if lam < 0:
+                    return 0.22 + 1.402*lam + 0.018*lam/(0.107 + lam)
+                return 0.22 + 1.57*lam - 1.8*lam*lam
+            lam = np.asarray(lam)
+            return np.where(lam < 0,
+                            0.22 + 1.402*lam + 0.018*lam/(0.107 + lam),
+                            0.22 + 1.57*lam - 1.8*lam*lam)
 
         def H(lam):
             # NOTE: C&B's H function is not continuous at lam=0,
             #       so using second interval
-            return np.piecewise(lam, [lam < 0, lam >= 0],
-                                [lambda lam: 2.088 + 0.0731/(0.14 + lam),
-                                 lambda lam: 2.61 - 3.75*lam + 5.24*lam**2])
+            if isinstance(lam, (int, float)):
+                if lam < 0:
+                    return 2.088 + 0.0731/(0.14 + lam)
+                return 2.61 - 3.75*lam + 5.24*lam*lam
+            lam = np.asarray(lam)
+            return np.where(lam < 0, 2.088 + 0.0731/(0.14 + lam),
+                            2.61 - 3.75*lam + 5.24*lam*lam)
 
         def Hp(lam):
             # NOTE: C&B's H function is not continuous at lam=0,
             #       so using second interval
-            return np.piecewise(lam, [lam < 0, lam >= 0],
-                                [lambda lam: -0.0731/(0.14 + lam)**2,
-                                 lambda lam: -3.75 + 2*5.24*lam])
+            if isinstance(lam, (int, float)):
+                if lam < 0:
+                    return -0.0731/(0.14 + lam)**2
+                return -3.75 + 2*5.24*lam
+            lam = np.asarray(lam)
+            return np.where(lam < 0, -0.0731/(0.14 + lam)**2,
+                            -3.75 + 2*5.24*lam)
 
         super().__init__("Cebeci and Bradshaw", S, H, Hp, -0.1, 0.1)
 
@@ -554,14 +775,24 @@ class _ThwaitesFunctionsCebeciBradshaw(_ThwaitesFunctions):
 class _ThwaitesFunctionsSpline(_ThwaitesFunctions):
     """Returns cubic splines of Thwaites tables based on Edland 2021."""
 
+    __slots__ = ()
+
     def __init__(self):
         # Spline fits to Thwaites original data Edland
         S = CubicSpline(self._tab_lambda, self._tab_S)
         H = CubicSpline(self._tab_lambda, self._tab_H)
         Hp = H.derivative()
 
-        super().__init__("Thwaites Splines", S, H, Hp,
-                         np.min(self._tab_lambda), np.max(self._tab_lambda))
+        # NOTE: The shear and shape functions are also fit together so that
+        #       both can be found from one interval search when needed at
+        #       the same lambda.
+        SH = CubicSpline(self._tab_lambda, self._tab[1:3], axis=1)
+
+        super().__init__("Thwaites Splines", _piecewise_poly_evaluator(S),
+                         _piecewise_poly_evaluator(H),
+                         _piecewise_poly_evaluator(Hp),
+                         np.min(self._tab_lambda), np.max(self._tab_lambda),
+                         _piecewise_poly_evaluator(SH))
 
     # Tabular data section
     _tab_F = np.array([0.938, 0.953, 0.956, 0.962, 0.967, 0.969, 0.971, 0.970,
@@ -585,6 +816,12 @@ class _ThwaitesFunctionsSpline(_ThwaitesFunctions):
                             +0.000, 0.016,  0.032,  0.048,  0.064,  0.080,
                             +0.10,  0.12,   0.14,   0.20,   0.25])
 
+    # NOTE: Tables are stored as rows of one contiguous array of lambda, S, H,
+    #       and F, and the individual tables are views into it.
+    _tab = np.ascontiguousarray(np.stack([_tab_lambda, _tab_S, _tab_H,
+                                          _tab_F]))
+    _tab_lambda, _tab_S, _tab_H, _tab_F = _tab
+
 
 class _ThwaitesSeparationEvent(IBLTermEvent):
     """
@@ -623,6 +860,9 @@ class _ThwaitesSeparationEvent(IBLTermEvent):
         float
             Current value of the shear function.
         """
+        if np.isscalar(x):
+            # solver passes scalar location, so avoid array overhead
+            return self._S_fun(self._calc_lam(float(x), float(F[0])))
         return self._S_fun(self._calc_lam(x, F))
 
     def event_info(self):
@@ -60,6 +60,31 @@ class TestHeadMethod(unittest.TestCase):
         self.assertIsNone(npt.assert_allclose(HeadMethod._H_d(3.3),
                                               HeadMethod._H_d(3.323)))
 
+    def testH1DerivativeCalculation(self):
+        """Test the H1 derivative calculation."""
+        # test H1' for a range of H_d
+        def H1p_fun(H_d):
+            if H_d <= 1.6:
+                return -0.8234*1.287/(H_d - 1.1)**2.287
+            return -1.5501*3.064/(H_d - 0.6778)**4.064
+        H_d = np.linspace(1.11, 2.4, 101)
+        H1p_ref = np.zeros_like(H_d)
+        for i, H_di in enumerate(H_d):
+            H1p_ref[i] = H1p_fun(H_di)
+        H1p = HeadMethod._H1p(H_d)
+        self.assertIsNone(npt.assert_allclose(H1p, H1p_ref))
+
+        # test combined calculation matches individual ones
+        H1, H1p = HeadMethod._H1_and_H1p(H_d)
+        self.assertIsNone(npt.assert_allclose(H1, HeadMethod._H1(H_d)))
+        self.assertIsNone(npt.assert_allclose(H1p, H1p_ref))
+
+        # test for invalid values
+        self.assertIsNone(npt.assert_allclose(HeadMethod._H1p(1.1),
+                                              HeadMethod._H1p(1.1001)))
+        self.assertIsNone(npt.assert_allclose(HeadMethod._H1_and_H1p(1.1),
+                                              HeadMethod._H1_and_H1p(1.1001)))
+
     def testEntrainmentVelocityCalculation(self):
         """Test the entrainment velocity calculations."""
         # test calculation of term
@@ -77,6 +102,46 @@ class TestHeadMethod(unittest.TestCase):
         self.assertIsNone(npt.assert_allclose(HeadMethod._S(3),
                                               HeadMethod._S(3.001)))
 
+    def testUnmodeledProperties(self):
+        """Test the properties the Head method does not model are zero."""
+        hm = HeadMethod(nu=1e-5, U_e=lambda x: 10*x)
+        for x in [1, np.array([1, 2, 3])]:
+            for val in [hm.delta_k(x), hm.H_k(x), hm.D(x, 1)]:
+                self.assertEqual(np.shape(val), np.shape(x))
+                self.assertEqual(np.asarray(val).dtype, np.float64)
+                self.assertIsNone(npt.assert_array_equal(val, 0))
+
+    def testODEStateUnchanged(self):
+        """Test that the ODE right-hand side does not modify its state."""
+        hm = HeadMethod(nu=1e-5, U_e=lambda x: 10*x,
+                        dU_edx=lambda x: 10*np.ones_like(x),
+                        d2U_edx2=np.zeros_like)
+        hm.set_initial_parameters(delta_m0=1e-3, H_d0=1.4)
+        hm._ode_setup()
+
+        # scalar location as used by solver
+        F = np.array([1e-3, 1.05])
+        F_ref = F.copy()
+        yp = hm._ode_impl(1.0, F)
+        self.assertIsNone(npt.assert_array_equal(F, F_ref))
+        self.assertEqual(yp.shape, F.shape)
+
+        # vector of locations
+        x = np.array([0.5, 1.0, 1.5])
+        F = np.array([[1e-3, 1e-3, 2e-3], [1.05, 1.4, 1.6]])
+        F_ref = F.copy()
+        yp = hm._ode_impl(x, F)
+        self.assertIsNone(npt.assert_array_equal(F, F_ref))
+        self.assertEqual(yp.shape, F.shape)
+
+        # changing the velocity after setup is used by scalar locations
+        hm.set_velocity(U_e=lambda x: 2 + x**3, dU_edx=lambda x: 3*x**2,
+                        d2U_edx2=lambda x: 6*x)
+        yp_ref = hm._ode_impl(x, F)
+        for i, xi in enumerate(x):
+            yp = hm._ode_impl(xi, F[:, i])
+            self.assertIsNone(npt.assert_allclose(yp, yp_ref[:, i]))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=1)
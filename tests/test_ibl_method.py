@@ -5,20 +5,78 @@ Created on Tue Aug  9 17:26:49 2022
 
 @author: ddmarshall
 """
+# pylint: disable=protected-access
 
 
 import unittest
+import functools
+import math
 from typing import Tuple
 import numpy as np
 import numpy.testing as npt
 import numpy.typing as np_type
-from scipy.interpolate import PchipInterpolator
+from scipy.interpolate import CubicHermiteSpline, PchipInterpolator, PPoly
 
 from pyBL.ibl_method import IBLMethod
 from pyBL.ibl_method import IBLTermEvent
 from pyBL.ibl_method import IBLResult
 
 
+def integrate_ppoly(poly, c0):
+    """
+    Return the integral of piecewise polynomial starting at a value.
+
+    The coefficients of each interval are integrated directly and the
+    constant of each interval is the running sum of the interval integrals,
+    so the result is continuous and equal to c0 at the first breakpoint.
+    """
+    k = poly.c.shape[0]
+    c = np.empty((k + 1,) + poly.c.shape[1:])
+    c[:-1] = poly.c/np.arange(k, 0, -1)[:, np.newaxis]
+    h = np.diff(poly.x)
+    c[-1, 0] = 0.0
+    c[-1, 1:] = np.cumsum(np.polyval(c[:-1, :-1], h[:-1])*h[:-1])
+    c[-1] += c0
+    return PPoly(c, poly.x)
+
+
+class SharedPPolyFamily:
+    """
+    PCHIP of samples along with its first two derivatives.
+
+    The derivatives are found by differentiating the coefficients of each
+    interval directly instead of creating new spline objects, and all three
+    share the same breakpoints so they can be evaluated with one interval
+    search.
+
+    Attributes
+    ----------
+        poly: PCHIP of the samples.
+    """
+
+    # pylint: disable=too-few-public-methods
+    def __init__(self, x_sample, y_sample):
+        self.poly = PchipInterpolator(x_sample, y_sample)
+        dpoly_c = self.poly.c[:-1]*np.array([3, 2, 1])[:, np.newaxis]
+        ddpoly_c = dpoly_c[:-1]*np.array([2, 1])[:, np.newaxis]
+        self._breaks = self.poly.x
+        self._coefs = (self.poly.c, dpoly_c, ddpoly_c)
+
+    def eval_all(self, x):
+        """Return the spline and its first two derivatives at locations."""
+        x = np.asarray(x, dtype=float)
+        i = np.clip(np.searchsorted(self._breaks, x, side="right") - 1, 0,
+                    self._breaks.shape[0] - 2)
+        t = x - self._breaks[i]
+        vals = []
+        for coefs in self._coefs:
+            val = coefs[0, i]
+            for ck in coefs[1:]:
+                val = val*t + ck[i]
+            vals.append(val)
+        return vals[0], vals[1], vals[2]
+
+
 class TestIBLResult(unittest.TestCase):
     """Class to test IBLResult."""
 
@@ -34,6 +92,20 @@ class TestIBLResult(unittest.TestCase):
                    "    success: True")
         self.assertEqual(str_ref, str(iblr))
 
+        # arrays are formatted the same as lists
+        iblr = IBLResult(x_end=2.1, F_end=np.array([1.4, -2.3]), status=0,
+                         message="Success", success=True)
+        self.assertEqual(str_ref, str(iblr))
+
+        # default values are scalars
+        str_ref = ("IBLResult:\n"
+                   "    x_end: inf\n"
+                   "    F_end: inf\n"
+                   "    status: -99\n"
+                   "    message: Not Set\n"
+                   "    success: False")
+        self.assertEqual(str_ref, str(IBLResult()))
+
 
 class _IBLMethodTestTermEvent(IBLTermEvent):
     """
@@ -49,7 +121,7 @@ class _IBLMethodTestTermEvent(IBLTermEvent):
 
     # pylint: disable=too-few-public-methods
     def __init__(self, x_kill):
-        self._x_kill = x_kill
+        self._x_kill = float(x_kill)
         super().__init__()
 
     def _call_impl(self, x, F):
@@ -70,7 +142,7 @@ class _IBLMethodTestTermEvent(IBLTermEvent):
             the integration has passed the termination condition, and zero at
             the state when the integrator should terminate.
         """
-        return x - self._x_kill
+        return float(x) - self._x_kill
 
     def event_info(self):
         return -1, ""
@@ -113,29 +185,31 @@ class IBLMethodTest(IBLMethod):
         _ = F
         return x
 
+    # NOTE: The property stubs return read-only views of a zero instead of
+    #       allocating new arrays since the results are never modified.
     def V_e(self, x):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
     def delta_d(self, x):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
     def delta_m(self, x):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
     def delta_k(self, x):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
     def H_d(self, x):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
     def H_k(self, x):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
     def tau_w(self, x, rho):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
     def D(self, x, rho):
-        return np.zeros_like(x)
+        return np.broadcast_to(0.0, np.shape(x))
 
 
 class IBLMethodTestTransition(IBLTermEvent):
@@ -143,11 +217,11 @@ class IBLMethodTestTransition(IBLTermEvent):
 
     # pylint: disable=too-few-public-methods
     def __init__(self, F_kill):
-        self._F_kill = F_kill
+        self._F_kill = float(F_kill)
         super().__init__()
 
     def _call_impl(self, x, F):
-        return F[0] - self._F_kill
+        return float(F[0]) - self._F_kill
 
     def event_info(self):
         return 1, ""
@@ -156,13 +230,40 @@ class IBLMethodTestTransition(IBLTermEvent):
 class TestEdgeVelocity(unittest.TestCase):
     """Class to test various functions and curve fits for Thwaites method"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the grids and splines shared by the velocity tests."""
+        cls.X_QUERY = np.linspace(0.1, 5, 21)
+        cls.X_QUERY.setflags(write=False)
+        cls.X_SAMPLE = np.linspace(0.1, 5, 8)
+        cls.X_SAMPLE.setflags(write=False)
+
+        # NOTE: Splines are keyed by the velocity scale, the exponent, and
+        #       the order of the derivative that was sampled. The
+        #       coefficients are read-only since the splines are shared.
+        x_sample = cls.X_SAMPLE
+        U_inf = 10
+        m = 1.25
+        cls._pchip = {}
+        for n, fun in enumerate([cls.U_e_fun, cls.dU_edx_fun,
+                                 cls.d2U_edx2_fun]):
+            family = SharedPPolyFamily(x_sample, fun(x_sample, U_inf, m))
+            family.poly.c.setflags(write=False)
+            cls._pchip[(U_inf, m, n)] = family
+
+    @staticmethod
+    def _check(iblb, x, refs):
+        """Compare the three velocity terms against references together."""
+        npt.assert_allclose(np.stack([iblb.U_e(x), iblb.dU_edx(x),
+                                      iblb.d2U_edx2(x)]), np.stack(refs))
+
     # define the edge velocity functions
     @classmethod
     def U_e_fun(cls, x, C, m):
         """Return edge velocity."""
         x = np.asarray(x)
         if m == 0:
-            return C*np.ones_like(x)
+            return np.broadcast_to(float(C), x.shape)
         return C*x**m
 
     @classmethod
@@ -170,9 +271,9 @@ class TestEdgeVelocity(unittest.TestCase):
         """Return the streamwise derivative of edge velocity."""
         x = np.asarray(x)
         if m == 0:
-            return np.zeros_like(x)
+            return np.broadcast_to(0.0, x.shape)
         if m == 1:
-            return C*np.ones_like(x)
+            return np.broadcast_to(float(C), x.shape)
         return m*C*x**(m-1)
 
     @classmethod
@@ -180,9 +281,9 @@ class TestEdgeVelocity(unittest.TestCase):
         """Return the streamwise second derivative of edge velocity."""
         x = np.asarray(x)
         if m in (0, 1):
-            return np.zeros_like(x)
+            return np.broadcast_to(0.0, x.shape)
         if m == 2:
-            return m*C*np.ones_like(x)
+            return np.broadcast_to(float(m*C), x.shape)
         return m*(m-1)*C*x**(m-2)
 
     @classmethod
@@ -190,157 +291,180 @@ class TestEdgeVelocity(unittest.TestCase):
         """Return the streamwise third derivative of edge velocity."""
         x = np.asarray(x)
         if m in (0, 1, 2):
-            return np.zeros_like(x)
+            return np.broadcast_to(0.0, x.shape)
         if m == 3:
-            return m*(m-1)*C*np.ones_like(x)
+            return np.broadcast_to(float(m*(m-1)*C), x.shape)
         return m*(m-1)*(m-2)*C*x**(m-3)
 
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def make_velocity_fun(cls, C, m, n=0):
+        """
+        Return function for the edge velocity or one of its derivatives.
+
+        The exponent is resolved when the function is created so that the
+        returned function only needs to do the power law calculation. The
+        functions are cached since the tests only use a few parameter sets.
+        """
+        coef = float(C)
+        for k in range(n):
+            coef *= m - k
+        p = m - n
+
+        if coef == 0:
+            return lambda x: np.broadcast_to(0.0, np.shape(x))
+        if p == 0:
+            return lambda x: np.broadcast_to(coef, np.shape(x))
+        if p == 1:
+            return lambda x: coef*x
+        if p == 2:
+            return lambda x: coef*x*x
+        return lambda x: coef*np.power(x, p)
+
     def test_setting_velocity_functions(self):
         """Test setting the velocity functions."""
-        # create test class with all three functions
+        # create velocity functions from all three functions
         U_inf = 10
         m = 0.75
-        iblb = IBLMethodTest(U_e=lambda x: self.U_e_fun(x, U_inf, m),
-                             dU_edx=lambda x: self.dU_edx_fun(x, U_inf, m),
-                             d2U_edx2=lambda x: self.d2U_edx2_fun(x, U_inf, m))
+        vel = IBLMethod.velocity_only(
+            U_e=self.make_velocity_fun(U_inf, m),
+            dU_edx=self.make_velocity_fun(U_inf, m, 1),
+            d2U_edx2=self.make_velocity_fun(U_inf, m, 2))
 
-        x = np.linspace(0.1, 5, 21)
+        x = self.X_QUERY
         U_e_ref = self.U_e_fun(x, U_inf, m)
         dU_edx_ref = self.dU_edx_fun(x, U_inf, m)
         d2U_edx2_ref = self.d2U_edx2_fun(x, U_inf, m)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        self._check(vel, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
 
-        # create test class with two functions
+        # create velocity functions from two functions
         U_inf = 10
         m = 0.75
-        iblb = IBLMethodTest(U_e=lambda x: self.U_e_fun(x, U_inf, m),
-                             dU_edx=lambda x: self.dU_edx_fun(x, U_inf, m))
+        vel = IBLMethod.velocity_only(
+            U_e=self.make_velocity_fun(U_inf, m),
+            dU_edx=self.make_velocity_fun(U_inf, m, 1))
 
-        x = np.linspace(0.1, 5, 21)
+        x = self.X_QUERY
         U_e_ref = self.U_e_fun(x, U_inf, m)
         dU_edx_ref = self.dU_edx_fun(x, U_inf, m)
         d2U_edx2_ref = self.d2U_edx2_fun(x, U_inf, m)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        self._check(vel, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
 
-        # create test class with one function
+        # create velocity functions from one function
         U_inf = 10
         m = 0.75
-        iblb = IBLMethodTest(U_e=lambda x: self.U_e_fun(x, U_inf, m))
+        vel = IBLMethod.velocity_only(U_e=self.make_velocity_fun(U_inf, m))
 
-        x = np.linspace(0.1, 5, 21)
+        x = self.X_QUERY
         U_e_ref = self.U_e_fun(x, U_inf, m)
         dU_edx_ref = self.dU_edx_fun(x, U_inf, m)
         d2U_edx2_ref = self.d2U_edx2_fun(x, U_inf, m)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
+        npt.assert_allclose(vel.U_e(x), U_e_ref)
+        npt.assert_allclose(vel.dU_edx(x), dU_edx_ref)
         # NOTE: second derivative has slightly larger errors
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref,
-                                              rtol=1e-5, atol=0))
+        npt.assert_allclose(vel.d2U_edx2(x), d2U_edx2_ref,
+                            rtol=1e-5, atol=0)
 
     def test_setting_velocity_splines(self):
         """Test setting the velocity with splines."""
         # set the edge velocity spline
-        x_sample = np.linspace(0.1, 5, 8)
+        x_sample = self.X_SAMPLE
         U_inf = 10
         m = 1.25
-        U_e = PchipInterpolator(x_sample, self.U_e_fun(x_sample, U_inf, m))
-        dU_edx = U_e.derivative()
-        d2U_edx2 = dU_edx.derivative()
-        iblb = IBLMethodTest(U_e=U_e)
+        family = self._pchip[(U_inf, m, 0)]
+        iblb = IBLMethodTest(U_e=family.poly)
 
-        x = np.linspace(0.1, 5, 21)
-        U_e_ref = U_e(x)
-        dU_edx_ref = dU_edx(x)
-        d2U_edx2_ref = d2U_edx2(x)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        x = self.X_QUERY
+        U_e_ref, dU_edx_ref, d2U_edx2_ref = family.eval_all(x)
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
 
         # set the edge velocity derivative spline
-        x_sample = np.linspace(0.1, 5, 8)
+        x_sample = self.X_SAMPLE
         U_inf = 10
         m = 1.25
-        dU_edx = PchipInterpolator(x_sample,
-                                   self.dU_edx_fun(x_sample, U_inf, m))
-        U_e = dU_edx.antiderivative()
-        U_e.c[-1,:] = U_e.c[-1,:]+self.U_e_fun(x_sample[0], U_inf, m)
-        d2U_edx2 = dU_edx.derivative()
+        U0 = float(self.U_e_fun(x_sample[0], U_inf, m))
+        family = self._pchip[(U_inf, m, 1)]
+        dU_edx = family.poly
+        U_e = integrate_ppoly(dU_edx, U0)
         iblb = IBLMethodTest(U_e=U_e, dU_edx=dU_edx)
 
-        x = np.linspace(0.1, 5, 21)
+        x = self.X_QUERY
         U_e_ref = U_e(x)
-        dU_edx_ref = dU_edx(x)
-        d2U_edx2_ref = d2U_edx2(x)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        dU_edx_ref, d2U_edx2_ref, _ = family.eval_all(x)
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
 
         # set the edge velocity second derivative spline
-        x_sample = np.linspace(0.1, 5, 8)
+        x_sample = self.X_SAMPLE
         U_inf = 10
         m = 1.25
-        d2U_edx2 = PchipInterpolator(x_sample,
-                                     self.d2U_edx2_fun(x_sample, U_inf, m))
-        dU_edx = d2U_edx2.antiderivative()
-        dU_edx.c[-1,:] = dU_edx.c[-1,:]+self.dU_edx_fun(x_sample[0], U_inf, m)
-        U_e = dU_edx.antiderivative()
-        U_e.c[-1,:] = U_e.c[-1,:]+self.U_e_fun(x_sample[0], U_inf, m)
+        dU0 = float(self.dU_edx_fun(x_sample[0], U_inf, m))
+        d2U_edx2 = self._pchip[(U_inf, m, 2)].poly
+        dU_edx = integrate_ppoly(d2U_edx2, dU0)
+        U_e = integrate_ppoly(dU_edx, U0)
         iblb = IBLMethodTest(U_e=U_e, dU_edx=dU_edx, d2U_edx2=d2U_edx2)
 
-        x = np.linspace(0.1, 5, 21)
+        x = self.X_QUERY
         U_e_ref = U_e(x)
         dU_edx_ref = dU_edx(x)
         d2U_edx2_ref = d2U_edx2(x)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
 
     def test_setting_velocity_points(self):
         """Test setting velocity from points."""
         # set the edge velocity values
-        x_sample = np.linspace(0.1, 5, 8)
+        x_sample = self.X_SAMPLE
         U_inf = 10
         m = 1.25
         U_e = [x_sample, self.U_e_fun(x_sample, U_inf, m)]
-        U_e_spline = PchipInterpolator(x_sample, self.U_e_fun(x_sample,
-                                                              U_inf, m))
-        dU_edx_spline = U_e_spline.derivative()
-        d2U_edx2_spline = dU_edx_spline.derivative()
+        family = self._pchip[(U_inf, m, 0)]
         iblb = IBLMethodTest(U_e=U_e)
 
-        x = np.linspace(0.1, 5, 21)
-        U_e_ref = U_e_spline(x)
-        dU_edx_ref = dU_edx_spline(x)
-        d2U_edx2_ref = d2U_edx2_spline(x)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        x = self.X_QUERY
+        U_e_ref, dU_edx_ref, d2U_edx2_ref = family.eval_all(x)
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
 
         # set the edge velocity derivative points
-        x_sample = np.linspace(0.1, 5, 8)
+        x_sample = self.X_SAMPLE
         U_inf = 10
         m = 1.25
         U_e = self.U_e_fun(x_sample[0], U_inf, m)
         dU_edx = [x_sample, self.dU_edx_fun(x_sample, U_inf, m)]
-        dU_edx_spline = PchipInterpolator(x_sample, self.dU_edx_fun(x_sample,
-                                                                    U_inf, m))
-        U_e_spline = dU_edx_spline.antiderivative()
-        U_e_spline.c[-1,:] = (U_e_spline.c[-1,:]
-                              + self.U_e_fun(x_sample[0], U_inf, m))
-        d2U_edx2_spline = dU_edx_spline.derivative()
+        family = self._pchip[(U_inf, m, 1)]
+        U_e_spline = integrate_ppoly(family.poly, float(U_e))
         iblb = IBLMethodTest(U_e=U_e, dU_edx=dU_edx)
 
-        x = np.linspace(0.1, 5, 21)
+        x = self.X_QUERY
         U_e_ref = U_e_spline(x)
-        dU_edx_ref = dU_edx_spline(x)
-        d2U_edx2_ref = d2U_edx2_spline(x)
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        dU_edx_ref, d2U_edx2_ref, _ = family.eval_all(x)
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
+
+        # set the edge velocity values and derivative points
+        x_sample = self.X_SAMPLE
+        U_inf = 10
+        m = 1.25
+        U_e_pts = self.U_e_fun(x_sample, U_inf, m)
+        dU_edx_pts = self.dU_edx_fun(x_sample, U_inf, m)
+        U_e_spline = CubicHermiteSpline(x_sample, U_e_pts, dU_edx_pts)
+        iblb = IBLMethodTest(U_e=[x_sample, U_e_pts],
+                             dU_edx=[x_sample, dU_edx_pts])
+
+        x = self.X_QUERY
+        U_e_ref = U_e_spline(x)
+        dU_edx_ref = U_e_spline(x, 1)
+        d2U_edx2_ref = U_e_spline(x, 2)
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
+        npt.assert_allclose(iblb.dU_edx(x_sample), dU_edx_pts)
+
+        with self.assertRaises(ValueError):
+            IBLMethodTest(U_e=[x_sample, U_e_pts],
+                          dU_edx=[x_sample+0.1, dU_edx_pts])
+
+        # derivative functions are ignored with velocity points
+        iblb = IBLMethodTest(U_e=[x_sample, U_e_pts],
+                             dU_edx=lambda x: self.dU_edx_fun(x, U_inf, m))
+        family = self._pchip[(U_inf, m, 0)]
+        U_e_ref, dU_edx_ref, d2U_edx2_ref = family.eval_all(x)
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
 
     def test_delay_setting_velocity(self):
         """Test setting the velocity after class creation."""
@@ -348,7 +472,7 @@ class TestEdgeVelocity(unittest.TestCase):
         U_inf = 10
         m = 0.75
         iblb = IBLMethodTest()
-        x = np.linspace(0.1, 5, 21)
+        x = self.X_QUERY
         U_e_ref = self.U_e_fun(x, U_inf, m)
         dU_edx_ref = self.dU_edx_fun(x, U_inf, m)
         d2U_edx2_ref = self.d2U_edx2_fun(x, U_inf, m)
@@ -360,12 +484,71 @@ class TestEdgeVelocity(unittest.TestCase):
         with self.assertRaises(ValueError):
             iblb.d2U_edx2(x)
 
-        iblb.set_velocity(U_e=lambda x: self.U_e_fun(x, U_inf, m),
-                          dU_edx=lambda x: self.dU_edx_fun(x, U_inf, m),
-                          d2U_edx2=lambda x: self.d2U_edx2_fun(x, U_inf, m))
-        self.assertIsNone(npt.assert_allclose(iblb.U_e(x), U_e_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.dU_edx(x), dU_edx_ref))
-        self.assertIsNone(npt.assert_allclose(iblb.d2U_edx2(x), d2U_edx2_ref))
+        iblb.set_velocity(U_e=self.make_velocity_fun(U_inf, m),
+                          dU_edx=self.make_velocity_fun(U_inf, m, 1),
+                          d2U_edx2=self.make_velocity_fun(U_inf, m, 2))
+        self._check(iblb, x, (U_e_ref, dU_edx_ref, d2U_edx2_ref))
+
+    def test_scalar_evaluator(self):
+        """Test the scalar evaluation of the velocity functions."""
+        # spline functions are evaluated directly, including extrapolation
+        x_sample = self.X_SAMPLE
+        U_inf = 10
+        m = 1.25
+        U_e = self._pchip[(U_inf, m, 0)].poly
+        x = np.linspace(-1, 6, 29)
+        for U_e_fun in [U_e, U_e.derivative(), U_e.derivative(2)]:
+            U_e_scalar = IBLMethod._scalar_evaluator(U_e_fun)
+            U_e_ref = U_e_fun(x)
+            for i, xi in enumerate(x):
+                self.assertIsInstance(U_e_scalar(float(xi)), float)
+                npt.assert_allclose(U_e_scalar(float(xi)), U_e_ref[i])
+
+        # other functions are called
+        U_e_scalar = IBLMethod._scalar_evaluator(lambda x:
+                                                 self.U_e_fun(x, U_inf, m))
+        for xi in x_sample:
+            npt.assert_allclose(U_e_scalar(xi), self.U_e_fun(xi, U_inf, m))
+
+        # evaluators are only recreated when velocity changes
+        iblb = IBLMethodTest(U_e=U_e)
+        U_e_scalar, dU_edx_scalar = iblb._scalar_velocity()
+        self.assertIs(iblb._scalar_velocity()[0], U_e_scalar)
+        self.assertIs(iblb._scalar_velocity()[1], dU_edx_scalar)
+        iblb.set_velocity(U_e=lambda x: self.U_e_fun(x, U_inf, m))
+        self.assertIsNot(iblb._scalar_velocity()[0], U_e_scalar)
+        npt.assert_allclose(iblb._scalar_velocity()[0](2.0),
+                            self.U_e_fun(2.0, U_inf, m))
+
+    def test_velocity_terms(self):
+        """Test evaluating the velocity terms together."""
+        x_sample = self.X_SAMPLE
+        U_inf = 10
+        m = 1.25
+        x = np.linspace(-1, 6, 29)
+
+        # splines from points share interval search
+        iblb = IBLMethodTest(U_e=[x_sample,
+                                  self.U_e_fun(x_sample, U_inf, m)])
+        U_e, dU_edx, d2U_edx2 = iblb._velocity_terms(x)
+        npt.assert_allclose(U_e, iblb.U_e(x))
+        npt.assert_allclose(dU_edx, iblb.dU_edx(x))
+        npt.assert_allclose(d2U_edx2, iblb.d2U_edx2(x))
+        U_e, dU_edx, d2U_edx2 = iblb._velocity_terms(2.0)
+        npt.assert_allclose(U_e, iblb.U_e(2.0))
+        npt.assert_allclose(dU_edx, iblb.dU_edx(2.0))
+        npt.assert_allclose(d2U_edx2, iblb.d2U_edx2(2.0))
+
+        # other functions are called
+        iblb = IBLMethodTest(U_e=lambda x: self.U_e_fun(x, U_inf, m),
+                             dU_edx=lambda x: self.dU_edx_fun(x, U_inf, m),
+                             d2U_edx2=lambda x: self.d2U_edx2_fun(x, U_inf,
+                                                                  m))
+        x = x_sample
+        U_e, dU_edx, d2U_edx2 = iblb._velocity_terms(x)
+        npt.assert_allclose(U_e, self.U_e_fun(x, U_inf, m))
+        npt.assert_allclose(dU_edx, self.dU_edx_fun(x, U_inf, m))
+        npt.assert_allclose(d2U_edx2, self.d2U_edx2_fun(x, U_inf, m))
 
     def test_terminating_solver(self):
         """Test early termination of solver."""
@@ -380,8 +563,11 @@ class TestEdgeVelocity(unittest.TestCase):
         # NOTE: No need to set the velocity terms because they are not used in
         #       this basic implementation.
         # NOTE: This solves the simple differential equation y'=x
+        def ref_y(x):
+            return 0.5*x**2+1.0
+
         def ref_fun(x):
-            return np.array([0.5*x**2+1])
+            return np.array([ref_y(x)])
 
         x_start = 1
         x_end = 2
@@ -391,7 +577,7 @@ class TestEdgeVelocity(unittest.TestCase):
         self.assertEqual(rtn.status, 0)
         self.assertEqual(rtn.message, "Completed")
         self.assertEqual(rtn.x_end, x_end)
-        self.assertIsNone(npt.assert_allclose(rtn.F_end, ref_fun(x_end)))
+        npt.assert_allclose(rtn.F_end, ref_fun(x_end))
 
         # stop because solver terminated early
         x_start = 1
@@ -402,21 +588,21 @@ class TestEdgeVelocity(unittest.TestCase):
         self.assertEqual(rtn.status, -1)
         self.assertEqual(rtn.message, "Separated")
         self.assertEqual(rtn.x_end, x_kill)
-        self.assertIsNone(npt.assert_allclose(rtn.F_end, ref_fun(x_kill)))
+        npt.assert_allclose(rtn.F_end, ref_fun(x_kill))
 
         # stop because external trigger
         x_start = 1
         x_end = x_kill + 1
         iblb.y0 = ref_fun(x_start)
-        y_trans = 0.5*(iblb.y0+ref_fun(x_kill))[0]
-        x_trans = np.sqrt(2*(y_trans-1))
+        y_trans = 0.5*(float(iblb.y0[0])+ref_y(x_kill))
+        x_trans = math.sqrt(2.0*(y_trans-1.0))
         rtn = iblb.solve(x_start, x_end,
                          term_event=IBLMethodTestTransition(y_trans))
         self.assertTrue(rtn.success)
         self.assertEqual(rtn.status, 1)
         self.assertEqual(rtn.message, "Transition")
         self.assertEqual(rtn.x_end, x_trans)
-        self.assertIsNone(npt.assert_allclose(rtn.F_end, y_trans))
+        npt.assert_allclose(rtn.F_end, y_trans)
 
 
 if __name__ == "__main__":
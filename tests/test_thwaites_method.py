@@ -11,7 +11,7 @@ Created on Mon Aug  8 14:09:25 2022
 import unittest
 import numpy as np
 import numpy.testing as npt
-from scipy.misc import derivative as fd
+from scipy.interpolate import CubicSpline
 
 from pyBL.thwaites_method import ThwaitesMethodLinear
 from pyBL.thwaites_method import ThwaitesMethodNonlinear
@@ -20,6 +20,31 @@ from pyBL.thwaites_method import _ThwaitesFunctionsCebeciBradshaw
 from pyBL.thwaites_method import _ThwaitesFunctionsSpline
 
 
+def fd1(fun, x, dx):
+    """Return central difference approximation of first derivative."""
+    return (fun(x + dx) - fun(x - dx))/(2*dx)
+
+
+def check_scalar_ode(test, cls):
+    """Check scalar right-hand side evaluations match the vector ones."""
+    x = np.array([0.5, 1.0, 1.5])
+    F = np.array([1e-3, 2e-3, 3e-3])
+    tm = cls(nu=1e-5, U_e=lambda x: 10*x,
+             dU_edx=lambda x: 10*np.ones_like(x), d2U_edx2=np.zeros_like)
+    yp_ref = tm._ode_impl(x, F)
+    for i, xi in enumerate(x):
+        yp = tm._ode_impl(xi, F[i:i+1])
+        test.assertIsNone(npt.assert_allclose(yp, yp_ref[i:i+1]))
+
+    # changing the velocity is used by the scalar evaluation
+    tm.set_velocity(U_e=lambda x: 5*x**2, dU_edx=lambda x: 10*x,
+                    d2U_edx2=lambda x: 10*np.ones_like(x))
+    yp_ref = tm._ode_impl(x, F)
+    for i, xi in enumerate(x):
+        yp = tm._ode_impl(xi, F[i:i+1])
+        test.assertIsNone(npt.assert_allclose(yp, yp_ref[i:i+1]))
+
+
 class TestCurveFits(unittest.TestCase):
     """Class to test various functions and curve fits for Thwaites method"""
 
@@ -117,7 +142,7 @@ class TestCurveFits(unittest.TestCase):
         Hp = np.zeros_like(lam)
         delta = 1e-5
         for i, l in enumerate(lam):
-            Hp[i] = fd(H_fun, l, l*delta, n=1, order=3)
+            Hp[i] = fd1(H_fun, l, l*delta)
         self.assertIsNone(npt.assert_allclose(Hp, white.Hp(lam)))
 
         # check to make sure does not calculate outside of range
@@ -152,6 +177,9 @@ class TestCurveFits(unittest.TestCase):
         # check to make sure does not calculate outside of range
         self.assertIsNone(npt.assert_allclose(cb.S(lam_min), cb.S(2*lam_min)))
         self.assertIsNone(npt.assert_allclose(cb.S(lam_max), cb.S(2*lam_max)))
+        self.assertIsNone(npt.assert_allclose(cb.S([2*lam_min, 0,
+                                                    2*lam_max]),
+                                              cb.S([lam_min, 0, lam_max])))
 
         # test H function
         def H_fun(lam):
@@ -175,7 +203,7 @@ class TestCurveFits(unittest.TestCase):
         Hp = np.zeros_like(lam)
         delta = 1e-5
         for i, l in enumerate(lam):
-            Hp[i] = fd(H_fun, l, np.maximum(l*delta, delta), n=1, order=3)
+            Hp[i] = fd1(H_fun, l, np.maximum(l*delta, delta))
 
         self.assertIsNone(npt.assert_allclose(Hp, cb.Hp(lam)))
 
@@ -225,8 +253,7 @@ class TestCurveFits(unittest.TestCase):
         Hp = np.zeros_like(lam)
         delta = 1e-8
         for i, l in enumerate(lam):
-            Hp[i] = fd(spline.H, l, np.maximum(l*delta, delta),
-                       n=1, order=3)
+            Hp[i] = fd1(spline.H, l, np.maximum(l*delta, delta))
 
         self.assertIsNone(npt.assert_allclose(Hp, spline.Hp(lam)))
 
@@ -236,6 +263,29 @@ class TestCurveFits(unittest.TestCase):
         self.assertIsNone(npt.assert_allclose(spline.Hp(lam_max),
                                               spline.Hp(2*lam_max)))
 
+        # test evaluation between the tabulated points
+        lam = np.linspace(lam_min, lam_max, 57)
+        S_fun = CubicSpline(self.lam_ref, self.S_ref)
+        H_fun = CubicSpline(self.lam_ref, self.H_ref)
+        Hp_fun = H_fun.derivative()
+        self.assertIsNone(npt.assert_allclose(spline.S(lam), S_fun(lam)))
+        self.assertIsNone(npt.assert_allclose(spline.H(lam), H_fun(lam)))
+        self.assertIsNone(npt.assert_allclose(spline.Hp(lam), Hp_fun(lam)))
+        for l in lam:
+            self.assertIsNone(npt.assert_allclose(spline.S(l), S_fun(l)))
+            self.assertIsNone(npt.assert_allclose(spline.H(l), H_fun(l)))
+            self.assertIsNone(npt.assert_allclose(spline.Hp(l), Hp_fun(l)))
+
+        # test evaluating both S and H together
+        lam = np.linspace(2*lam_min, 2*lam_max, 57)
+        S, H = spline.S_and_H(lam)
+        self.assertIsNone(npt.assert_allclose(S, spline.S(lam)))
+        self.assertIsNone(npt.assert_allclose(H, spline.H(lam)))
+        for l in lam:
+            S, H = spline.S_and_H(l)
+            self.assertIsNone(npt.assert_allclose(S, spline.S(l)))
+            self.assertIsNone(npt.assert_allclose(H, spline.H(l)))
+
 
 class ThwaitesLinearAnalytic:
     """Analytic result for power-law, linear Thwaites method."""
@@ -251,7 +301,7 @@ class ThwaitesLinearAnalytic:
 
     def V_e(self, x):
         """Return the transpiration velocity."""
-        ddelta_ddx = fd(self.delta_d, x, 1e-5, n=1, order=3)
+        ddelta_ddx = fd1(self.delta_d, x, 1e-5)
         return self.U_ref*x**self.m*(self.m*self.delta_d(x)/x+ddelta_ddx)
 
     def delta_d(self, x):
@@ -432,6 +482,56 @@ class TestLinearThwaites(unittest.TestCase):
             ThwaitesMethodLinear(nu=nu, U_e=U_e_fun, dU_edx=dU_edx_fun,
                                  d2U_edx2=d2U_edx2_fun, data_fits="My Own")
 
+    def testCustomShapeDerivative(self):
+        """Test the derivative of own shape function outside table range."""
+        tm = ThwaitesMethodLinear(nu=1e-5, U_e=lambda x: 10*x,
+                                  data_fits=(lambda lam: (lam + 0.09)**0.62,
+                                             lambda lam: 2 + lam**2))
+        lam = np.array([-0.5, -0.2, 0, 0.1, 0.5, 1.0])
+        self.assertIsNone(npt.assert_allclose(tm._model.Hp(lam), 2*lam,
+                                              atol=1e-8))
+        self.assertIsNone(npt.assert_allclose(tm._model.Hp(0.5), 1.0))
+
+    @staticmethod
+    def _wedge_solution(U_ref, m, nu, x):
+        """Return linear Thwaites method solved for a wedge flow."""
+        tm = ThwaitesMethodLinear(nu=nu, U_e=lambda x: U_ref*x**m,
+                                  dU_edx=lambda x: m*U_ref*x**(m-1),
+                                  d2U_edx2=lambda x: m*(m-1)*U_ref*x**(m-2),
+                                  data_fits="Spline")
+        tm_ref = ThwaitesLinearAnalytic(U_ref, m, nu, tm._model.H, tm._model.S)
+        tm.set_initial_parameters(delta_m0=tm_ref.delta_m(x[0]))
+        tm.solve(x0=x[0], x_end=x[-1])
+        return tm
+
+    def testEvaluateAll(self):
+        """Test evaluating the properties together."""
+        rho = 1
+        x = np.linspace(0.1, 2, 101)
+        tm = self._wedge_solution(U_ref=10, m=0.5, nu=1e-5, x=x)
+
+        props = tm.evaluate_all(x, rho)
+        self.assertIsNone(npt.assert_allclose(props["delta_m"],
+                                              tm.delta_m(x)))
+        self.assertIsNone(npt.assert_allclose(props["delta_d"],
+                                              tm.delta_d(x)))
+        self.assertIsNone(npt.assert_allclose(props["H_d"], tm.H_d(x)))
+        self.assertIsNone(npt.assert_allclose(props["tau_w"],
+                                              tm.tau_w(x, rho)))
+        self.assertIsNone(tm.evaluate_all(x)["tau_w"])
+
+    def testIntegerLocations(self):
+        """Test querying properties at integer locations."""
+        rho = 1
+        x = np.linspace(0.1, 2, 101)
+        tm = self._wedge_solution(U_ref=10, m=0.5, nu=1e-5, x=x)
+
+        x_int = np.array([1, 2])
+        self.assertIsNone(npt.assert_allclose(tm.H_d(x_int),
+                                              tm.H_d(x_int.astype(float))))
+        self.assertEqual(tm.delta_k(x_int).dtype, np.float64)
+        self.assertEqual(tm.D(x_int, rho).dtype, np.float64)
+
     def testWedge050Case(self):
         """Test the m=0.50 wedge case."""
         # set parameters
@@ -690,6 +790,10 @@ class TestLinearThwaites(unittest.TestCase):
                                               tm_ref.tau_w(x, rho)))
         self.assertIsNone(npt.assert_allclose(tm.V_e(x), tm_ref.V_e(x)))
 
+    def testODEScalarLocation(self):
+        """Test the right-hand side at scalar locations without solving."""
+        check_scalar_ode(self, ThwaitesMethodLinear)
+
 
 class TestNonlinearThwaites(unittest.TestCase):
     """Class to test the implementation of the nonlinear Thwaites method"""
@@ -1121,6 +1225,10 @@ class TestNonlinearThwaites(unittest.TestCase):
         self.assertIsNone(npt.assert_allclose(tm.V_e(x), tm_ref.V_e(x),
                                               atol=0, rtol=1e-2))
 
+    def testODEScalarLocation(self):
+        """Test the right-hand side at scalar locations without solving."""
+        check_scalar_ode(self, ThwaitesMethodNonlinear)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=1)